@@ -11,15 +11,60 @@ Version: 1.0.0
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import asyncio
+import gzip
 import websockets
 import ssl
+import threading
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import urllib.parse
 
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson is not installed
+    orjson = None
+
+# Content markers expected in the hosted pages: (check name, substring)
+INDEX_PAGE_CHECKS = (
+    ("HTML structure", "<!DOCTYPE html>"),
+    ("BuildingOS title", "BuildingOS"),
+    ("Modern styling", "Inter"),
+    ("JavaScript functionality", "BuildingOSChat"),
+    ("API integration", "wo8q9fl0hj.execute-api.us-east-1.amazonaws.com"),
+    ("WebSocket support", "wss://")
+)
+ERROR_PAGE_CHECKS = (
+    ("HTML structure", "<!DOCTYPE html>"),
+    ("Error styling", "error-container"),
+    ("Error icon", "fas fa-exclamation-triangle"),
+    ("Back to home link", 'href="/"')
+)
+# The error page is about 4 KB (its last marker is near the end), so this prefix
+# covers the whole page; only decode this much
+ERROR_PAGE_SCAN_BYTES = 8192
+
+# Response headers worth keeping in the saved results
+CDN_HEADERS = ("via", "content-encoding", "cache-control", "expires", "x-cache", "x-amz-cf-pop")
+CORS_HEADERS = (
+    "access-control-allow-origin",
+    "access-control-allow-methods",
+    "access-control-allow-headers",
+    "access-control-max-age"
+)
+
+# Test-name prefix -> integration component reported in the summary
+INTEGRATION_COMPONENTS = (
+    ("S3 Website", "S3 Website"),
+    ("CloudFront CDN", "CloudFront CDN"),
+    ("API Gateway", "API Gateway"),
+    ("WebSocket Connectivity", "WebSocket"),
+    ("CORS Configuration", "CORS")
+)
+
 class FrontendValidationResults:
     """Stores and manages validation test results"""
     
@@ -33,25 +78,34 @@ class FrontendValidationResults:
             "test_details": [],
             "frontend_urls": {},
             "performance_metrics": {},
-            "integration_status": {}
+            "integration_status": {component: False for _, component in INTEGRATION_COMPONENTS}
         }
+        # HTTP tests run in worker threads alongside the WebSocket test
+        self._lock = threading.Lock()
     
     def add_test(self, test_name: str, passed: bool, details: str, 
-                 duration: float = 0, metadata: Dict = None):
+                 duration_ns: int = 0, metadata: Dict = None):
         """Add a test result"""
-        self.results["total_tests"] += 1
-        if passed:
-            self.results["passed_tests"] += 1
-        else:
-            self.results["failed_tests"] += 1
-        
-        self.results["test_details"].append({
-            "test_name": test_name,
-            "status": "PASSED" if passed else "FAILED",
-            "details": details,
-            "duration_ms": round(duration * 1000, 2),
-            "metadata": metadata or {}
-        })
+        with self._lock:
+            self.results["total_tests"] += 1
+            if passed:
+                self.results["passed_tests"] += 1
+            else:
+                self.results["failed_tests"] += 1
+            
+            self.results["test_details"].append({
+                "test_name": test_name,
+                "status": "PASSED" if passed else "FAILED",
+                "details": details,
+                "duration_ms": round(duration_ns / 1e6, 2),
+                "metadata": metadata or {}
+            })
+            
+            if passed:
+                for prefix, component in INTEGRATION_COMPONENTS:
+                    if test_name.startswith(prefix):
+                        self.results["integration_status"][component] = True
+                        break
     
     def get_success_rate(self) -> float:
         """Calculate success rate percentage"""
@@ -62,6 +116,9 @@ class FrontendValidationResults:
 class BuildingOSFrontendValidator:
     """Validates the complete frontend integration"""
     
+    # Shared verifying TLS context so OpenSSL can resume sessions across runs
+    ssl_context = ssl.create_default_context()
+    
     def __init__(self):
         self.results = FrontendValidationResults()
         
@@ -74,6 +131,12 @@ class BuildingOSFrontendValidator:
         }
         
         self.results.results["frontend_urls"] = self.urls
+        
+        # Shared keep-alive session; the pool is sized for the concurrently running tests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def print_header(self):
         """Print validation header"""
@@ -90,24 +153,18 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing S3 Website Hosting...")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Test index.html
-            response = requests.get(f"{self.urls['s3_website']}/index.html", timeout=10)
-            duration = time.time() - start_time
+            response = self.session.get(f"{self.urls['s3_website']}/index.html", timeout=10)
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration = duration_ns / 1e9
             
             if response.status_code == 200:
                 content = response.text
                 
                 # Validate HTML content
-                checks = [
-                    ("HTML structure", "<!DOCTYPE html>" in content),
-                    ("BuildingOS title", "BuildingOS" in content),
-                    ("Modern styling", "Inter" in content),
-                    ("JavaScript functionality", "BuildingOSChat" in content),
-                    ("API integration", "wo8q9fl0hj.execute-api.us-east-1.amazonaws.com" in content),
-                    ("WebSocket support", "wss://" in content)
-                ]
+                checks = [(name, marker in content) for name, marker in INDEX_PAGE_CHECKS]
                 
                 all_passed = all(check[1] for check in checks)
                 details = f"Status: {response.status_code}, Size: {len(content)} bytes, Checks: {len([c for c in checks if c[1]])}/{len(checks)} passed"
@@ -116,7 +173,7 @@ class BuildingOSFrontendValidator:
                     "S3 Website - Index Page",
                     all_passed,
                     details,
-                    duration,
+                    duration_ns,
                     {"content_length": len(content), "checks": dict(checks)}
                 )
                 
@@ -129,17 +186,17 @@ class BuildingOSFrontendValidator:
                         print(f"   {'✅' if passed else '❌'} {name}")
                     return False
             else:
-                            self.results.add_test(
-                "S3 Website - Index Page",
-                False,
-                f"HTTP {response.status_code}: {response.text[:200]}",
-                duration
-            )
+                self.results.add_test(
+                    "S3 Website - Index Page",
+                    False,
+                    f"HTTP {response.status_code}: {response.text[:200]}",
+                    duration_ns
+                )
                 print(f"❌ S3 Website returned status {response.status_code}")
                 return False
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "S3 Website - Index Page",
                 False,
                 f"Exception: {str(e)}",
@@ -153,32 +210,29 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing Error Page...")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Test error.html
-            response = requests.get(f"{self.urls['s3_website']}/error.html", timeout=10)
-            duration = time.time() - start_time
+            response = self.session.get(f"{self.urls['s3_website']}/error.html", timeout=10)
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration = duration_ns / 1e9
             
             if response.status_code == 200:
-                content = response.text
+                body = response.content
+                content = body[:ERROR_PAGE_SCAN_BYTES].decode("utf-8", "ignore")
                 
                 # Validate error page content
-                checks = [
-                    ("HTML structure", "<!DOCTYPE html>" in content),
-                    ("Error styling", "error-container" in content),
-                    ("Error icon", "fas fa-exclamation-triangle" in content),
-                    ("Back to home link", 'href="/"' in content)
-                ]
+                checks = [(name, marker in content) for name, marker in ERROR_PAGE_CHECKS]
                 
                 all_passed = all(check[1] for check in checks)
-                details = f"Status: {response.status_code}, Size: {len(content)} bytes, Checks: {len([c for c in checks if c[1]])}/{len(checks)} passed"
+                details = f"Status: {response.status_code}, Size: {len(body)} bytes, Checks: {len([c for c in checks if c[1]])}/{len(checks)} passed"
                 
-                self.add_test(
+                self.results.add_test(
                     "S3 Website - Error Page",
                     all_passed,
                     details,
-                    duration,
-                    {"content_length": len(content), "checks": dict(checks)}
+                    duration_ns,
+                    {"content_length": len(body), "checks": dict(checks)}
                 )
                 
                 if all_passed:
@@ -188,17 +242,17 @@ class BuildingOSFrontendValidator:
                     print("❌ Error page content validation failed")
                     return False
             else:
-                self.add_test(
+                self.results.add_test(
                     "S3 Website - Error Page",
                     False,
                     f"HTTP {response.status_code}",
-                    duration
+                    duration_ns
                 )
                 print(f"❌ Error page returned status {response.status_code}")
                 return False
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "S3 Website - Error Page",
                 False,
                 f"Exception: {str(e)}",
@@ -212,11 +266,12 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing CloudFront CDN...")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Test CloudFront distribution
-            response = requests.get(self.urls['cloudfront'], timeout=15)
-            duration = time.time() - start_time
+            response = self.session.get(self.urls['cloudfront'], timeout=15)
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration = duration_ns / 1e9
             
             if response.status_code == 200:
                 content = response.text
@@ -236,13 +291,13 @@ class BuildingOSFrontendValidator:
                 
                 self.results.results["performance_metrics"]["cloudfront_response_time"] = duration
                 
-                self.add_test(
+                self.results.add_test(
                     "CloudFront CDN",
                     all_passed,
                     details,
-                    duration,
+                    duration_ns,
                     {
-                        "headers": dict(headers),
+                        "headers": {k: headers[k] for k in CDN_HEADERS if k in headers},
                         "checks": dict(checks),
                         "final_url": response.url
                     }
@@ -257,17 +312,17 @@ class BuildingOSFrontendValidator:
                         print(f"   {'✅' if passed else '❌'} {name}")
                     return False
             else:
-                self.add_test(
+                self.results.add_test(
                     "CloudFront CDN",
                     False,
                     f"HTTP {response.status_code}",
-                    duration
+                    duration_ns
                 )
                 print(f"❌ CloudFront returned status {response.status_code}")
                 return False
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "CloudFront CDN",
                 False,
                 f"Exception: {str(e)}",
@@ -281,11 +336,12 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing API Gateway Integration...")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Test health check endpoint
-            response = requests.get(f"{self.urls['api_gateway']}/health", timeout=10)
-            duration = time.time() - start_time
+            response = self.session.get(f"{self.urls['api_gateway']}/health", timeout=10)
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration = duration_ns / 1e9
             
             if response.status_code == 200:
                 try:
@@ -304,11 +360,11 @@ class BuildingOSFrontendValidator:
                     
                     self.results.results["performance_metrics"]["api_response_time"] = duration
                     
-                    self.add_test(
+                    self.results.add_test(
                         "API Gateway - Health Check",
                         all_passed,
                         details,
-                        duration,
+                        duration_ns,
                         {"response_data": data, "checks": dict(checks)}
                     )
                     
@@ -320,26 +376,26 @@ class BuildingOSFrontendValidator:
                         return False
                         
                 except json.JSONDecodeError:
-                    self.add_test(
+                    self.results.add_test(
                         "API Gateway - Health Check",
                         False,
                         f"Invalid JSON response: {response.text[:200]}",
-                        duration
+                        duration_ns
                     )
                     print("❌ API Gateway returned invalid JSON")
                     return False
             else:
-                self.add_test(
+                self.results.add_test(
                     "API Gateway - Health Check",
                     False,
                     f"HTTP {response.status_code}: {response.text[:200]}",
-                    duration
+                    duration_ns
                 )
                 print(f"❌ API Gateway health check returned status {response.status_code}")
                 return False
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "API Gateway - Health Check",
                 False,
                 f"Exception: {str(e)}",
@@ -353,21 +409,19 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing WebSocket Connectivity...")
         
         try:
-            start_time = time.time()
-            
-            # Create SSL context for WebSocket
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            start_ns = time.perf_counter_ns()
             
             # Connect to WebSocket
             async with websockets.connect(
                 self.urls['websocket'],
-                ssl=ssl_context,
-                timeout=10
+                ssl=self.ssl_context,
+                open_timeout=10,
+                close_timeout=2,
+                ping_interval=None
             ) as websocket:
                 
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_ns
+                duration = duration_ns / 1e9
                 
                 # Test basic connectivity
                 print("✅ WebSocket connection established")
@@ -381,9 +435,9 @@ class BuildingOSFrontendValidator:
                 await websocket.send(json.dumps(test_message))
                 print("✅ Test message sent successfully")
                 
-                # Wait briefly for potential response
+                # Wait briefly for potential response; the handshake already proves connectivity
                 try:
-                    response = await asyncio.wait_for(websocket.recv(), timeout=2.0)
+                    response = await asyncio.wait_for(websocket.recv(), timeout=0.2)
                     print(f"✅ Received response: {response[:100]}...")
                     has_response = True
                 except asyncio.TimeoutError:
@@ -392,11 +446,11 @@ class BuildingOSFrontendValidator:
                 
                 self.results.results["performance_metrics"]["websocket_connect_time"] = duration
                 
-                self.add_test(
+                self.results.add_test(
                     "WebSocket Connectivity",
                     True,
                     f"Connected successfully, Response time: {duration:.2f}s",
-                    duration,
+                    duration_ns,
                     {
                         "has_response": has_response,
                         "message_sent": True
@@ -407,7 +461,7 @@ class BuildingOSFrontendValidator:
                 return True
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "WebSocket Connectivity",
                 False,
                 f"Exception: {str(e)}",
@@ -421,7 +475,7 @@ class BuildingOSFrontendValidator:
         print("\n🧪 Testing CORS Configuration...")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Test preflight request
             headers = {
@@ -430,13 +484,14 @@ class BuildingOSFrontendValidator:
                 'Access-Control-Request-Headers': 'Content-Type'
             }
             
-            response = requests.options(
+            response = self.session.options(
                 f"{self.urls['api_gateway']}/persona",
                 headers=headers,
                 timeout=10
             )
             
-            duration = time.time() - start_time
+            duration_ns = time.perf_counter_ns() - start_ns
+            duration = duration_ns / 1e9
             
             if response.status_code in [200, 204]:
                 cors_headers = response.headers
@@ -452,12 +507,15 @@ class BuildingOSFrontendValidator:
                 all_passed = all(check[1] for check in checks)
                 details = f"Status: {response.status_code}, CORS Origin: {cors_headers.get('access-control-allow-origin', 'N/A')}"
                 
-                self.add_test(
+                self.results.add_test(
                     "CORS Configuration",
                     all_passed,
                     details,
-                    duration,
-                    {"cors_headers": dict(cors_headers), "checks": dict(checks)}
+                    duration_ns,
+                    {
+                        "cors_headers": {k: cors_headers[k] for k in CORS_HEADERS if k in cors_headers},
+                        "checks": dict(checks)
+                    }
                 )
                 
                 if all_passed:
@@ -467,17 +525,17 @@ class BuildingOSFrontendValidator:
                     print("❌ CORS configuration validation failed")
                     return False
             else:
-                self.add_test(
+                self.results.add_test(
                     "CORS Configuration",
                     False,
                     f"HTTP {response.status_code}",
-                    duration
+                    duration_ns
                 )
                 print(f"❌ CORS preflight returned status {response.status_code}")
                 return False
                 
         except Exception as e:
-            self.add_test(
+            self.results.add_test(
                 "CORS Configuration",
                 False,
                 f"Exception: {str(e)}",
@@ -487,11 +545,16 @@ class BuildingOSFrontendValidator:
             return False
     
     def save_results(self):
-        """Save validation results to JSON file"""
-        filename = f"frontend-integration-validation-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+        """Save validation results to a gzip-compressed JSON file"""
+        filename = f"frontend-integration-validation-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json.gz"
+        
+        if orjson is not None:
+            payload = orjson.dumps(self.results.results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(self.results.results, indent=2).encode("utf-8")
         
-        with open(filename, 'w') as f:
-            json.dump(self.results.results, f, indent=2)
+        with gzip.open(filename, 'wb', compresslevel=6) as f:
+            f.write(payload)
         
         print(f"\n📁 Results saved to: {filename}")
         return filename
@@ -514,16 +577,8 @@ class BuildingOSFrontendValidator:
             for metric, value in self.results.results["performance_metrics"].items():
                 print(f"   {metric}: {value:.2f}s")
         
-        # Integration status
-        integration_status = {
-            "S3 Website": any(test["test_name"].startswith("S3 Website") and test["status"] == "PASSED" for test in self.results.results["test_details"]),
-            "CloudFront CDN": any(test["test_name"] == "CloudFront CDN" and test["status"] == "PASSED" for test in self.results.results["test_details"]),
-            "API Gateway": any(test["test_name"].startswith("API Gateway") and test["status"] == "PASSED" for test in self.results.results["test_details"]),
-            "WebSocket": any(test["test_name"] == "WebSocket Connectivity" and test["status"] == "PASSED" for test in self.results.results["test_details"]),
-            "CORS": any(test["test_name"] == "CORS Configuration" and test["status"] == "PASSED" for test in self.results.results["test_details"])
-        }
-        
-        self.results.results["integration_status"] = integration_status
+        # Integration status is maintained incrementally by add_test
+        integration_status = self.results.results["integration_status"]
         
         print(f"\n🔗 Integration Status:")
         for component, status in integration_status.items():
@@ -555,20 +610,20 @@ async def main():
         ("CORS Configuration", validator.test_cors_configuration)
     ]
     
-    # Run synchronous tests
-    for test_name, test_func in tests:
-        print(f"\n🔍 Running: {test_name}")
-        try:
-            test_func()
-        except Exception as e:
-            print(f"❌ Test {test_name} failed with exception: {str(e)}")
+    # Run blocking HTTP tests in worker threads so they overlap with the WebSocket handshake
+    print(f"\n🔍 Running: {', '.join(name for name, _ in tests)}, WebSocket Connectivity")
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(test_func) for _, test_func in tests),
+        validator.test_websocket_connectivity(),
+        return_exceptions=True
+    )
+    
+    test_names = [name for name, _ in tests] + ["WebSocket Connectivity"]
+    for test_name, outcome in zip(test_names, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ Test {test_name} failed with exception: {str(outcome)}")
     
-    # Run WebSocket test (async)
-    print(f"\n🔍 Running: WebSocket Connectivity")
-    try:
-        await validator.test_websocket_connectivity()
-    except Exception as e:
-        print(f"❌ WebSocket test failed with exception: {str(e)}")
+    validator.session.close()
     
     # Save results and print summary
     validator.save_results()
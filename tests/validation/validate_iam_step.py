@@ -33,10 +33,19 @@ Security Principles:
 """
 
 import boto3
+import functools
+import io
 import json
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 # =============================================================================
 # Global Configuration
@@ -58,19 +67,51 @@ REQUIRED_CUSTOM_POLICIES = [
     "kms_access"  # Phase 4 preparation - policy exists but not attached yet
 ]
 
+# Policy description keywords, scanned in a single pass per description
+POLICY_CLASSIFIER = re.compile(r"dynamodb|sns|bedrock|websocket|api\s*gateway", re.IGNORECASE)
+
+# Normalized keyword -> custom policy type (in priority order when several match)
+KEYWORD_TO_POLICY_TYPE = {
+    "dynamodb": "dynamodb_access",
+    "sns": "sns_publish",
+    "bedrock": "bedrock_access",
+    "websocket": "apigateway_management",
+    "apigateway": "apigateway_management"
+}
+
+# Display names used in custom policy test output
+POLICY_TYPE_LABELS = {
+    "dynamodb_access": "DynamoDB",
+    "sns_publish": "SNS",
+    "bedrock_access": "Bedrock",
+    "apigateway_management": "API Gateway"
+}
+
 # Required AWS managed policies
-REQUIRED_MANAGED_POLICIES = [
+REQUIRED_MANAGED_POLICIES = frozenset([
     "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
     "arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole", 
     "arn:aws:iam::aws:policy/AWSXRayDaemonWriteAccess"
-]
+])
+
+# KMS actions the Phase 4 policy must grant (any one satisfies the check)
+KMS_REQUIRED_ACTIONS = frozenset(["kms:Decrypt", "kms:Encrypt", "kms:GenerateDataKey"])
+
+# Error codes that are retried once before a validator gives up
+THROTTLING_ERROR_CODES = frozenset(["Throttling", "ThrottlingException", "RequestLimitExceeded"])
 
-# AWS clients
-iam_client = boto3.client("iam")
-lambda_client = boto3.client("lambda")
+# AWS clients: adaptive retries back off on IAM throttling, and the larger
+# pool keeps concurrent validators from queueing on HTTPS connections
+AWS_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=25
+)
+iam_client = boto3.client("iam", config=AWS_CLIENT_CONFIG)
+lambda_client = boto3.client("lambda", config=AWS_CLIENT_CONFIG)
 
-# Global variables for cross-function communication
-LAMBDA_ROLE_ARN = None
+# Validators run concurrently; each thread buffers its output and flushes it as one block
+print_lock = threading.Lock()
+_output = threading.local()
 
 
 # =============================================================================
@@ -92,18 +133,61 @@ def print_header():
     print("\nStarting validation tests...\n")
 
 
+def call_with_throttle_retry(operation: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run an AWS operation, retrying once after a short pause if it was throttled."""
+    try:
+        return operation(*args, **kwargs)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in THROTTLING_ERROR_CODES:
+            raise
+        time.sleep(1)
+        return operation(*args, **kwargs)
+
+
+def describe_client_error(error: ClientError) -> str:
+    """Format a boto3 ClientError as 'Code: message' for test details."""
+    details = error.response.get("Error", {})
+    return f"{details.get('Code', 'Unknown')}: {details.get('Message', str(error))}"
+
+
+def classify_policy(description: str) -> Optional[str]:
+    """Return the custom policy type a policy description refers to, if any."""
+    keywords = {"".join(match.lower().split()) for match in POLICY_CLASSIFIER.findall(description)}
+    return next((policy_type for keyword, policy_type in KEYWORD_TO_POLICY_TYPE.items() if keyword in keywords), None)
+
+
+def get_output_buffer() -> io.StringIO:
+    """Return the calling thread's output buffer."""
+    buffer = getattr(_output, "buffer", None)
+    if buffer is None:
+        buffer = _output.buffer = io.StringIO()
+    return buffer
+
+
+def flush_output():
+    """Write the calling thread's buffered output to stdout in a single write."""
+    buffer = get_output_buffer()
+    text = buffer.getvalue()
+    if text:
+        with print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        buffer.seek(0)
+        buffer.truncate()
+
+
 def print_section(section_name: str):
     """Print a formatted section header."""
-    print(f"\n{'=' * 60}")
-    print(f"🧪 {section_name}")
-    print("=" * 60)
+    buffer = get_output_buffer()
+    buffer.write(f"\n{'=' * 60}\n")
+    buffer.write(f"🧪 {section_name}\n")
+    buffer.write("=" * 60 + "\n")
 
 
 def print_test(test_name: str, status: str, details: str):
     """Print a formatted test result."""
     status_emoji = "✅" if status == "PASS" else "❌"
-    print(f"{status_emoji} {test_name}: {status}")
-    print(f"   Details: {details}")
+    get_output_buffer().write(f"{status_emoji} {test_name}: {status}\n   Details: {details}\n")
 
 
 def print_summary(passed_tests: int, total_tests: int):
@@ -128,11 +212,151 @@ def print_summary(passed_tests: int, total_tests: int):
         print("- Verify all required policies are attached and permissions are correct")
 
 
+# =============================================================================
+# Policy Document Helpers
+# =============================================================================
+
+def as_list(value: Any) -> List[Any]:
+    """Normalize an IAM str-or-list field (Action, Resource, Statement) to a list."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def normalize_policy_document(document: Any) -> Dict[str, Any]:
+    """Return a policy document as a dict, decoding JSON strings."""
+    if isinstance(document, str):
+        return json.loads(document)
+    return document or {}
+
+
+def iter_statements(document: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterate policy statements, accepting a single statement or a list."""
+    yield from as_list(document.get("Statement"))
+
+
+# =============================================================================
+# IAM Snapshot
+# =============================================================================
+
+@dataclass
+class IamSnapshot:
+    """Point-in-time view of account roles and customer managed policies."""
+    roles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    policies: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def get_attached_policy_arns(self, role_name: str) -> List[str]:
+        """Return the managed policy ARNs attached to a role."""
+        role = self.roles.get(role_name, {})
+        return [policy["PolicyArn"] for policy in role.get("AttachedManagedPolicies", [])]
+
+    def is_policy_attached(self, role_name: str, policy_arn: str) -> bool:
+        """Return True if the managed policy is attached to the role."""
+        role = self.roles.get(role_name, {})
+        return any(
+            policy["PolicyArn"] == policy_arn
+            for policy in role.get("AttachedManagedPolicies", [])
+        )
+
+    def get_attached_custom_policies(self, role_name: str) -> List[Dict[str, Any]]:
+        """
+        Return snapshot details of the customer managed policies attached to a role.
+
+        AWS managed policies are never in the snapshot, so a single lookup
+        per attachment both filters them out and resolves the details.
+        """
+        return [
+            self.policies[policy_arn]
+            for policy_arn in self.get_attached_policy_arns(role_name)
+            if policy_arn in self.policies
+        ]
+
+    def get_policy_document(self, policy_arn: str) -> Optional[Dict[str, Any]]:
+        """Return the default version document of a customer managed policy."""
+        policy = self.policies.get(policy_arn)
+        if policy is None:
+            return None
+        for version in policy.get("PolicyVersionList", []):
+            if version.get("IsDefaultVersion"):
+                return version["Document"]
+        return None
+
+
+# GetAccountAuthorizationDetails filter -> response list holding those entities
+AUTHORIZATION_DETAIL_KEYS = {
+    "Role": "RoleDetailList",
+    "LocalManagedPolicy": "Policies"
+}
+
+
+def fetch_authorization_details(entity_filter: str) -> List[Dict[str, Any]]:
+    """Collect every entity of one type from GetAccountAuthorizationDetails."""
+    result_key = AUTHORIZATION_DETAIL_KEYS[entity_filter]
+    paginator = iam_client.get_paginator("get_account_authorization_details")
+    return [
+        entity
+        for page in paginator.paginate(Filter=[entity_filter])
+        for entity in page.get(result_key, [])
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def fetch_iam_snapshot() -> IamSnapshot:
+    """
+    Fetch all roles and customer managed policies with GetAccountAuthorizationDetails.
+
+    The paginated call returns trust policies, tags, attached policies and
+    policy documents inline, replacing per-resource get_role, get_policy and
+    get_policy_version round-trips. Roles and policies are paginated as two
+    independent streams on separate threads. AWS managed policies are not
+    requested since only their ARNs (available on the role) are validated.
+
+    The result is memoized so validators called on their own share one
+    fetch; main() clears the cache at startup.
+    """
+    with ThreadPoolExecutor(max_workers=len(AUTHORIZATION_DETAIL_KEYS)) as executor:
+        roles_future = executor.submit(call_with_throttle_retry, fetch_authorization_details, "Role")
+        policies_future = executor.submit(call_with_throttle_retry, fetch_authorization_details, "LocalManagedPolicy")
+        roles = roles_future.result()
+        policies = policies_future.result()
+    
+    # Decode every document once so validators never re-parse
+    for role in roles:
+        role["AssumeRolePolicyDocument"] = normalize_policy_document(role.get("AssumeRolePolicyDocument"))
+    for policy in policies:
+        for version in policy.get("PolicyVersionList", []):
+            version["Document"] = normalize_policy_document(version.get("Document"))
+    
+    return IamSnapshot(
+        roles={role["RoleName"]: role for role in roles},
+        policies={policy["Arn"]: policy for policy in policies}
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_account_id() -> str:
+    """Resolve the caller's AWS account ID once per process."""
+    return call_with_throttle_retry(boto3.client("sts", config=AWS_CLIENT_CONFIG).get_caller_identity)["Account"]
+
+
+def list_lambda_functions(name_filter: str) -> List[Tuple[str, str]]:
+    """Return (FunctionName, Role) for every Lambda function whose name contains the filter."""
+    paginator = lambda_client.get_paginator("list_functions")
+    return [
+        (function["FunctionName"], function["Role"])
+        for page in paginator.paginate(PaginationConfig={"PageSize": 50})
+        for function in page["Functions"]
+        if name_filter in function["FunctionName"]
+    ]
+
+
 # =============================================================================
 # Validation Functions
 # =============================================================================
 
-def validate_lambda_execution_role() -> bool:
+def validate_lambda_execution_role(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate the main Lambda execution role configuration.
     
@@ -142,19 +366,23 @@ def validate_lambda_execution_role() -> bool:
     - Role is properly tagged for compliance
     - Role ARN is captured for other validations
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if role validation passes
     """
     print_section("Lambda Execution Role Validation")
     
     try:
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
+            
         # Get the Lambda execution role
-        role_response = iam_client.get_role(RoleName=IAM_ROLE_NAME)
-        role = role_response["Role"]
-        
-        # Store role ARN for other tests
-        global LAMBDA_ROLE_ARN
-        LAMBDA_ROLE_ARN = role["Arn"]
+        role = snapshot.roles.get(IAM_ROLE_NAME)
+        if role is None:
+            print_test("Lambda Execution Role", "FAIL", f"Role not found: {IAM_ROLE_NAME}")
+            return False
         
         # Validate role name
         if role["RoleName"] == IAM_ROLE_NAME:
@@ -165,15 +393,11 @@ def validate_lambda_execution_role() -> bool:
             
         # Validate trust policy
         trust_policy = role["AssumeRolePolicyDocument"]
-        if isinstance(trust_policy, str):
-            trust_policy = json.loads(trust_policy)
-            
-        lambda_service_found = False
-        for statement in trust_policy.get("Statement", []):
-            principal = statement.get("Principal", {})
-            if isinstance(principal, dict) and principal.get("Service") == "lambda.amazonaws.com":
-                lambda_service_found = True
-                break
+        lambda_service_found = any(
+            isinstance(statement.get("Principal"), dict)
+            and "lambda.amazonaws.com" in as_list(statement["Principal"].get("Service"))
+            for statement in iter_statements(trust_policy)
+        )
                 
         if lambda_service_found:
             print_test("Trust Policy", "PASS", "Lambda service trust relationship configured")
@@ -182,8 +406,7 @@ def validate_lambda_execution_role() -> bool:
             return False
             
         # Validate role tagging
-        tags = {tag["Key"]: tag["Value"] for tag in role.get("Tags", [])}
-        project_tag = tags.get("Project")
+        project_tag = next((tag["Value"] for tag in role.get("Tags", []) if tag["Key"] == "Project"), None)
         if project_tag == PROJECT_NAME:
             print_test("Role Tagging", "PASS", f"Project tag: {project_tag}")
         else:
@@ -197,7 +420,7 @@ def validate_lambda_execution_role() -> bool:
         return False
 
 
-def validate_managed_policies() -> bool:
+def validate_managed_policies(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate AWS managed policies attached to Lambda execution role.
     
@@ -206,39 +429,41 @@ def validate_managed_policies() -> bool:
     - AWSLambdaVPCAccessExecutionRole for VPC networking
     - AWSXRayDaemonWriteAccess for distributed tracing
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if all managed policies are attached
     """
     print_section("AWS Managed Policies Validation")
     
     try:
-        if LAMBDA_ROLE_ARN is None:
-            print_test("Managed Policies", "FAIL", "Lambda role ARN not available from previous validation")
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
+            
+        if IAM_ROLE_NAME not in snapshot.roles:
+            print_test("Managed Policies", "FAIL", f"Lambda role not found: {IAM_ROLE_NAME}")
             return False
             
         # Get attached managed policies
-        attached_policies = iam_client.list_attached_role_policies(RoleName=IAM_ROLE_NAME)
-        attached_policy_arns = [policy["PolicyArn"] for policy in attached_policies["AttachedPolicies"]]
-        
-        all_policies_attached = True
+        attached_policy_arns = set(snapshot.get_attached_policy_arns(IAM_ROLE_NAME))
+        missing_policies = REQUIRED_MANAGED_POLICIES - attached_policy_arns
         
-        for required_policy in REQUIRED_MANAGED_POLICIES:
-            if required_policy in attached_policy_arns:
-                policy_name = required_policy.split("/")[-1]
-                print_test(f"Managed Policy {policy_name}", "PASS", f"Attached: {required_policy}")
-            else:
-                policy_name = required_policy.split("/")[-1] 
-                print_test(f"Managed Policy {policy_name}", "FAIL", f"Not attached: {required_policy}")
-                all_policies_attached = False
+        for required_policy in sorted(REQUIRED_MANAGED_POLICIES - missing_policies):
+            policy_name = required_policy.split("/")[-1]
+            print_test(f"Managed Policy {policy_name}", "PASS", f"Attached: {required_policy}")
+        for required_policy in sorted(missing_policies):
+            policy_name = required_policy.split("/")[-1]
+            print_test(f"Managed Policy {policy_name}", "FAIL", f"Not attached: {required_policy}")
                 
-        return all_policies_attached
+        return not missing_policies
         
     except Exception as e:
         print_test("Managed Policies", "FAIL", f"Exception: {str(e)}")
         return False
 
 
-def validate_custom_policies() -> bool:
+def validate_custom_policies(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate custom IAM policies for AWS service access.
     
@@ -248,55 +473,35 @@ def validate_custom_policies() -> bool:
     - Bedrock access policy for AI model invocation
     - API Gateway management policy for WebSocket connections
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if all custom policies are properly configured
     """
     print_section("Custom IAM Policies Validation")
     
     try:
-        if LAMBDA_ROLE_ARN is None:
-            print_test("Custom Policies", "FAIL", "Lambda role ARN not available from previous validation")
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
+            
+        if IAM_ROLE_NAME not in snapshot.roles:
+            print_test("Custom Policies", "FAIL", f"Lambda role not found: {IAM_ROLE_NAME}")
             return False
             
-        # Get attached policies to the role
-        attached_policies = iam_client.list_attached_role_policies(RoleName=IAM_ROLE_NAME)
-        attached_policy_arns = [policy["PolicyArn"] for policy in attached_policies["AttachedPolicies"]]
-        
-        # Filter out AWS managed policies (they start with arn:aws:iam::aws:policy/)
-        custom_policy_arns = [arn for arn in attached_policy_arns if not arn.startswith('arn:aws:iam::aws:policy/')]
-        
-        # Get details for each custom policy
-        custom_policies = []
-        for policy_arn in custom_policy_arns:
-            try:
-                policy_details = iam_client.get_policy(PolicyArn=policy_arn)
-                custom_policies.append(policy_details['Policy'])
-            except Exception as e:
-                print(f"DEBUG: Error getting policy details for {policy_arn}: {e}")
-        
-        # Custom policies found and validated
+        # Get details for each customer managed policy attached to the role
+        custom_policies = snapshot.get_attached_custom_policies(IAM_ROLE_NAME)
         
         # Validate each required custom policy type
         policies_found = {policy_type: False for policy_type in REQUIRED_CUSTOM_POLICIES}
         
         for policy in custom_policies:
-            policy_description = policy.get('Description', '').lower()
-            policy_arn = policy['Arn']
-            
             # All custom policies are already attached (we filtered them from attached policies)
             # Determine policy type based on description
-            if 'dynamodb' in policy_description:
-                policies_found['dynamodb_access'] = True
-                print_test("Custom Policy DynamoDB", "PASS", f"Found and attached: {policy['PolicyName']}")
-            elif 'sns' in policy_description:
-                policies_found['sns_publish'] = True
-                print_test("Custom Policy SNS", "PASS", f"Found and attached: {policy['PolicyName']}")
-            elif 'bedrock' in policy_description:
-                policies_found['bedrock_access'] = True  
-                print_test("Custom Policy Bedrock", "PASS", f"Found and attached: {policy['PolicyName']}")
-            elif 'websocket' in policy_description or 'api gateway' in policy_description:
-                policies_found['apigateway_management'] = True
-                print_test("Custom Policy API Gateway", "PASS", f"Found and attached: {policy['PolicyName']}")
+            policy_type = classify_policy(policy.get('Description', ''))
+            if policy_type is not None:
+                policies_found[policy_type] = True
+                print_test(f"Custom Policy {POLICY_TYPE_LABELS[policy_type]}", "PASS", f"Found and attached: {policy['PolicyName']}")
                     
         # Special handling for KMS policy - it exists but is not attached (Phase 4 preparation)
         # This will be validated separately in validate_kms_preparation()
@@ -317,7 +522,7 @@ def validate_custom_policies() -> bool:
         return False
 
 
-def validate_lambda_role_integration() -> bool:
+def validate_lambda_role_integration(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate that Lambda functions are using the correct execution role.
     
@@ -326,24 +531,26 @@ def validate_lambda_role_integration() -> bool:
     - Role ARN matches the validated role
     - Functions can assume the role successfully
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if Lambda role integration is correct
     """
     print_section("Lambda Role Integration Validation")
     
     try:
-        if LAMBDA_ROLE_ARN is None:
-            print_test("Lambda Role Integration", "FAIL", "Lambda role ARN not available from previous validation")
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
+            
+        role = snapshot.roles.get(IAM_ROLE_NAME)
+        if role is None:
+            print_test("Lambda Role Integration", "FAIL", f"Lambda role not found: {IAM_ROLE_NAME}")
             return False
+        lambda_role_arn = role["Arn"]
             
-        # Get all Lambda functions with our naming pattern
-        functions = lambda_client.list_functions()
-        buildingos_functions = []
-        
-        for function in functions["Functions"]:
-            function_name = function["FunctionName"]
-            if RESOURCE_PREFIX in function_name:
-                buildingos_functions.append(function)
+        # Get all Lambda functions with our naming pattern, keeping only name and role
+        buildingos_functions = call_with_throttle_retry(list_lambda_functions, RESOURCE_PREFIX)
                 
         if not buildingos_functions:
             print_test("Lambda Functions", "FAIL", f"No Lambda functions found with prefix: {RESOURCE_PREFIX}")
@@ -353,15 +560,12 @@ def validate_lambda_role_integration() -> bool:
         correct_role_count = 0
         total_functions = len(buildingos_functions)
         
-        for function in buildingos_functions:
-            function_name = function["FunctionName"]
-            function_role = function["Role"]
-            
-            if function_role == LAMBDA_ROLE_ARN:
+        for function_name, function_role in buildingos_functions:
+            if function_role == lambda_role_arn:
                 print_test(f"Lambda Function {function_name}", "PASS", f"Correct role: {function_role}")
                 correct_role_count += 1
             else:
-                print_test(f"Lambda Function {function_name}", "FAIL", f"Expected: {LAMBDA_ROLE_ARN}, Found: {function_role}")
+                print_test(f"Lambda Function {function_name}", "FAIL", f"Expected: {lambda_role_arn}, Found: {function_role}")
                 
         # Overall validation
         if correct_role_count == total_functions:
@@ -371,12 +575,15 @@ def validate_lambda_role_integration() -> bool:
             print_test("Overall Lambda Role Integration", "FAIL", f"Only {correct_role_count}/{total_functions} functions using correct role")
             return False
             
+    except ClientError as e:
+        print_test("Lambda Role Integration", "FAIL", f"AWS error {describe_client_error(e)}")
+        return False
     except Exception as e:
         print_test("Lambda Role Integration", "FAIL", f"Exception: {str(e)}")
         return False
 
 
-def validate_kms_preparation() -> bool:
+def validate_kms_preparation(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate KMS preparation for Phase 4 encryption implementation.
     
@@ -386,95 +593,90 @@ def validate_kms_preparation() -> bool:
     - KMS policy has proper service conditions
     - KMS policy is properly tagged for Phase 4
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if KMS preparation is correct
     """
     print_section("KMS Phase 4 Preparation Validation")
     
     try:
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
+            
         # Find the KMS policy
-        account_id = boto3.client('sts').get_caller_identity()['Account']
-        region = boto3.Session().region_name or 'us-east-1'
+        account_id = get_account_id()
         kms_policy_name = f"{RESOURCE_PREFIX}-lambda-kms-access"
         kms_policy_arn = f"arn:aws:iam::{account_id}:policy/{kms_policy_name}"
         
-        try:
-            # Check if KMS policy exists
-            kms_policy = iam_client.get_policy(PolicyArn=kms_policy_arn)
-            print_test("KMS Policy Exists", "PASS", f"KMS policy found: {kms_policy_name}")
-            
-            # Get policy version details
-            policy_version = iam_client.get_policy_version(
-                PolicyArn=kms_policy_arn,
-                VersionId=kms_policy['Policy']['DefaultVersionId']
-            )
-            
-            policy_document = policy_version['PolicyVersion']['Document']
-            
-            # Validate KMS permissions
-            kms_actions_found = False
-            service_conditions_found = False
-            
-            for statement in policy_document.get('Statement', []):
-                actions = statement.get('Action', [])
-                if isinstance(actions, str):
-                    actions = [actions]
-                    
-                # Check for required KMS actions
-                kms_actions = ['kms:Decrypt', 'kms:Encrypt', 'kms:GenerateDataKey']
-                if any(action in actions for action in kms_actions):
-                    kms_actions_found = True
-                    print_test("KMS Actions", "PASS", "Required KMS actions found in policy")
-                    
-                # Check for service conditions
-                conditions = statement.get('Condition', {})
-                string_equals = conditions.get('StringEquals', {})
-                via_service = string_equals.get('kms:ViaService', [])
+        # Check if KMS policy exists
+        policy_document = snapshot.get_policy_document(kms_policy_arn)
+        if policy_document is None:
+            print_test("KMS Policy Exists", "FAIL", f"KMS policy not found: {kms_policy_name}")
+            return False
+        print_test("KMS Policy Exists", "PASS", f"KMS policy found: {kms_policy_name}")
+        
+        # Validate KMS permissions
+        kms_actions_found = False
+        service_conditions_found = False
+        
+        for statement in iter_statements(policy_document):
+            actions = set(as_list(statement.get('Action')))
                 
-                if isinstance(via_service, list) and len(via_service) > 0:
-                    service_conditions_found = True
-                    print_test("KMS Service Conditions", "PASS", f"Service conditions found: {len(via_service)} services")
-            
-            if not kms_actions_found:
-                print_test("KMS Actions", "FAIL", "Required KMS actions not found in policy")
-                return False
+            # Check for required KMS actions
+            if KMS_REQUIRED_ACTIONS & actions:
+                kms_actions_found = True
+                print_test("KMS Actions", "PASS", "Required KMS actions found in policy")
                 
-            if not service_conditions_found:
-                print_test("KMS Service Conditions", "FAIL", "Service conditions not found in policy")
-                return False
+            # Check for service conditions
+            conditions = statement.get('Condition', {})
+            string_equals = conditions.get('StringEquals', {})
+            via_service = string_equals.get('kms:ViaService', [])
             
-            # Check that KMS policy is NOT attached to Lambda role (Phase 4 preparation)
-            attached_policies = iam_client.list_attached_role_policies(RoleName=IAM_ROLE_NAME)
-            attached_policy_arns = [policy["PolicyArn"] for policy in attached_policies["AttachedPolicies"]]
+            if isinstance(via_service, list) and len(via_service) > 0:
+                service_conditions_found = True
+                print_test("KMS Service Conditions", "PASS", f"Service conditions found: {len(via_service)} services")
             
-            if kms_policy_arn not in attached_policy_arns:
-                print_test("KMS Policy Attachment", "PASS", "KMS policy prepared but not attached (Phase 4 preparation)")
-            else:
-                print_test("KMS Policy Attachment", "FAIL", "KMS policy should not be attached until Phase 4")
-                return False
-                
-            # Check KMS policy tags
-            policy_tags = kms_policy['Policy'].get('Tags', [])
-            phase_tag = next((tag['Value'] for tag in policy_tags if tag['Key'] == 'Phase'), None)
+            if kms_actions_found and service_conditions_found:
+                break
+        
+        if not kms_actions_found:
+            print_test("KMS Actions", "FAIL", "Required KMS actions not found in policy")
+            return False
             
-            if phase_tag and '4' in phase_tag:
-                print_test("KMS Policy Tagging", "PASS", f"Phase tag found: {phase_tag}")
-            else:
-                print_test("KMS Policy Tagging", "FAIL", "Phase 4 tag not found on KMS policy")
-                return False
-                
-            return True
+        if not service_conditions_found:
+            print_test("KMS Service Conditions", "FAIL", "Service conditions not found in policy")
+            return False
+        
+        # Check that KMS policy is NOT attached to Lambda role (Phase 4 preparation)
+        if not snapshot.is_policy_attached(IAM_ROLE_NAME, kms_policy_arn):
+            print_test("KMS Policy Attachment", "PASS", "KMS policy prepared but not attached (Phase 4 preparation)")
+        else:
+            print_test("KMS Policy Attachment", "FAIL", "KMS policy should not be attached until Phase 4")
+            return False
             
-        except iam_client.exceptions.NoSuchEntityException:
-            print_test("KMS Policy Exists", "FAIL", f"KMS policy not found: {kms_policy_name}")
+        # Check KMS policy tags (not included in GetAccountAuthorizationDetails output)
+        policy_tags = call_with_throttle_retry(iam_client.list_policy_tags, PolicyArn=kms_policy_arn).get('Tags', [])
+        phase_tag = next((tag['Value'] for tag in policy_tags if tag['Key'] == 'Phase'), None)
+        
+        if phase_tag and '4' in phase_tag:
+            print_test("KMS Policy Tagging", "PASS", f"Phase tag found: {phase_tag}")
+        else:
+            print_test("KMS Policy Tagging", "FAIL", "Phase 4 tag not found on KMS policy")
             return False
             
+        return True
+            
+    except ClientError as e:
+        print_test("KMS Preparation", "FAIL", f"AWS error {describe_client_error(e)}")
+        return False
     except Exception as e:
         print_test("KMS Preparation", "FAIL", f"Exception: {str(e)}")
         return False
 
 
-def validate_security_compliance() -> bool:
+def validate_security_compliance(snapshot: Optional[IamSnapshot] = None) -> bool:
     """
     Validate security compliance and best practices.
     
@@ -484,19 +686,23 @@ def validate_security_compliance() -> bool:
     - Role creation date and last used information
     - No unused or overprivileged policies
     
+    Args:
+        snapshot: IAM snapshot shared by main(); fetched (memoized) if omitted
+    
     Returns:
         bool: True if security compliance checks pass
     """
     print_section("Security Compliance Validation")
     
     try:
-        if LAMBDA_ROLE_ARN is None:
-            print_test("Security Compliance", "FAIL", "Lambda role ARN not available from previous validation")
-            return False
+        if snapshot is None:
+            snapshot = fetch_iam_snapshot()
             
         # Get role details
-        role_response = iam_client.get_role(RoleName=IAM_ROLE_NAME)
-        role = role_response["Role"]
+        role = snapshot.roles.get(IAM_ROLE_NAME)
+        if role is None:
+            print_test("Security Compliance", "FAIL", f"Lambda role not found: {IAM_ROLE_NAME}")
+            return False
         
         # Check role age (should be recent for clean rebuild)
         create_date = role["CreateDate"]
@@ -514,8 +720,7 @@ def validate_security_compliance() -> bool:
             print_test("Role Usage", "PASS", "Role is newly created or usage tracking not yet available")
             
         # Validate policy compliance (basic check for now)
-        attached_policies = iam_client.list_attached_role_policies(RoleName=IAM_ROLE_NAME)
-        policy_count = len(attached_policies["AttachedPolicies"])
+        policy_count = len(snapshot.get_attached_policy_arns(IAM_ROLE_NAME))
         
         if policy_count > 0:
             print_test("Policy Attachment", "PASS", f"Role has {policy_count} attached policies")
@@ -534,6 +739,14 @@ def validate_security_compliance() -> bool:
 # Main Validation Function
 # =============================================================================
 
+def run_validation(validation_func, snapshot: IamSnapshot) -> bool:
+    """Run one validator and flush its buffered output as a single block."""
+    try:
+        return validation_func(snapshot)
+    finally:
+        flush_output()
+
+
 def main():
     """
     Main validation function that orchestrates all IAM and security tests.
@@ -550,6 +763,9 @@ def main():
     """
     print_header()
     
+    # Start from a fresh snapshot on every run
+    fetch_iam_snapshot.cache_clear()
+    
     # Track validation results
     validations = [
         ("Lambda Execution Role", validate_lambda_execution_role),
@@ -563,13 +779,33 @@ def main():
     passed_tests = 0
     total_tests = len(validations)
     
-    # Run all validations
-    for validation_name, validation_func in validations:
-        try:
-            if validation_func():
-                passed_tests += 1
-        except Exception as e:
-            print_test(validation_name, "FAIL", f"Unexpected error: {str(e)}")
+    # Fetch role and policy details once for all validators
+    try:
+        snapshot = fetch_iam_snapshot()
+    except ClientError as e:
+        print_test("IAM Snapshot", "FAIL", f"AWS error {describe_client_error(e)}")
+        flush_output()
+        print_summary(passed_tests, total_tests)
+        return 1
+    except Exception as e:
+        print_test("IAM Snapshot", "FAIL", f"Unable to fetch account authorization details: {str(e)}")
+        flush_output()
+        print_summary(passed_tests, total_tests)
+        return 1
+    
+    # Run all validations concurrently; they only read the shared snapshot
+    with ThreadPoolExecutor(max_workers=total_tests) as executor:
+        futures = [
+            (validation_name, executor.submit(run_validation, validation_func, snapshot))
+            for validation_name, validation_func in validations
+        ]
+        for validation_name, future in futures:
+            try:
+                if future.result():
+                    passed_tests += 1
+            except Exception as e:
+                print_test(validation_name, "FAIL", f"Unexpected error: {str(e)}")
+    flush_output()
     
     # Print summary
     print_summary(passed_tests, total_tests)
@@ -19,12 +19,15 @@
 # - Any failure blocks step completion
 # - Detailed error reporting for quick resolution
 #
-# **Dependencies:** boto3, requests, json, os, pathlib, subprocess
+# **Dependencies:** botocore, requests, json, os, pathlib, subprocess
 # **Integration:** Part of Step 2.1 validation framework
 #
 # =============================================================================
 
-import boto3
+import ast
+import botocore.session
+import concurrent.futures
+import functools
 import json
 import os
 import sys
@@ -34,6 +37,7 @@ import zipfile
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 import importlib.util
 
@@ -45,6 +49,18 @@ REGION = "us-east-1"
 ENVIRONMENT = "dev"
 PROJECT_PREFIX = "bos"
 
+# Lambda functions looked up concurrently; boto3 clients are thread-safe
+FUNCTION_LOOKUP_WORKERS = 16
+
+# Client configuration with a connection pool large enough for every lookup
+# worker, so concurrent calls are not serialized on the default 10 connections,
+# kept-alive sockets, and standard retries
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"mode": "standard", "max_attempts": 3},
+)
+
 # Expected Lambda functions that should use the common_utils layer
 EXPECTED_LAMBDA_FUNCTIONS = [
     "websocket-connect",
@@ -59,12 +75,18 @@ EXPECTED_LAMBDA_FUNCTIONS = [
     "agent-psim",
 ]
 
+# Layer source directory holding the Python modules
+LAYER_PYTHON_PATH = Path("src/layers/common_utils/python")
+
 # Expected Python modules in the layer
 EXPECTED_LAYER_MODULES = ["aws_clients.py", "utils.py", "models.py", "__init__.py"]
 
 # Expected dependencies in requirements.txt
 EXPECTED_DEPENDENCIES = ["boto3", "requests", "PyJWT"]
 
+# Bytes at the start of a module searched for its header comment block
+MODULE_HEADER_SCAN_BYTES = 4096
+
 # =============================================================================
 # Lambda Layer Validation Class
 # =============================================================================
@@ -81,9 +103,15 @@ class LambdaLayerValidator:
     def __init__(self):
         """Initialize validator with AWS clients and configuration"""
         try:
-            # Initialize AWS clients
-            self.lambda_client = boto3.client("lambda", region_name=REGION)
-            self.sts_client = boto3.client("sts", region_name=REGION)
+            # Initialize AWS clients from one session so they share its loaded
+            # service data and credentials
+            self._session = botocore.session.Session()
+            self.lambda_client = self._session.create_client(
+                "lambda", region_name=REGION, config=AWS_CLIENT_CONFIG
+            )
+            self.sts_client = self._session.create_client(
+                "sts", region_name=REGION, config=AWS_CLIENT_CONFIG
+            )
 
             # Get account information
             identity = self.sts_client.get_caller_identity()
@@ -94,6 +122,11 @@ class LambdaLayerValidator:
             self.passed_tests = 0
             self.failed_tests = 0
 
+            # Layer module sources, read once and shared by the code quality checks
+            self._module_sources: Dict[str, bytes] = {}
+            # Layer module syntax trees, parsed by the syntax validation
+            self._module_asts: Dict[str, ast.Module] = {}
+
             print(f"🔍 Lambda Layer Validator initialized")
             print(f"📍 Region: {REGION}")
             print(f"🔑 Account ID: {self.account_id}")
@@ -133,6 +166,24 @@ class LambdaLayerValidator:
         else:
             self.failed_tests += 1
 
+    @functools.cached_property
+    def _layer_entries(self) -> Optional[Dict[str, os.DirEntry]]:
+        """Layer source directory entries, scanned once (None if it is missing)"""
+        try:
+            with os.scandir(LAYER_PYTHON_PATH) as entries:
+                return {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            return None
+
+    def _module_source(self, module_file: str) -> bytes:
+        """Raw source of a layer module, read from disk on first use"""
+        source = self._module_sources.get(module_file)
+        if source is None:
+            with open(self._layer_entries[module_file].path, "rb") as f:
+                source = f.read()
+            self._module_sources[module_file] = source
+        return source
+
     # =============================================================================
     # Layer Infrastructure Validation
     # =============================================================================
@@ -210,14 +261,14 @@ class LambdaLayerValidator:
     def validate_layer_content_structure(self) -> bool:
         """Validate the structure and content of the Lambda layer"""
         try:
-            layer_path = Path("src/layers/common_utils/python")
+            layer_entries = self._layer_entries
 
-            if not layer_path.exists():
+            if layer_entries is None:
                 self.log_test_result(
                     "Layer Source Structure",
                     False,
                     "Layer source directory not found",
-                    {"expected_path": str(layer_path)},
+                    {"expected_path": str(LAYER_PYTHON_PATH)},
                 )
                 return False
 
@@ -226,8 +277,7 @@ class LambdaLayerValidator:
             found_modules = []
 
             for module in EXPECTED_LAYER_MODULES:
-                module_path = layer_path / module
-                if module_path.exists():
+                if module in layer_entries:
                     found_modules.append(module)
                 else:
                     missing_modules.append(module)
@@ -335,14 +385,29 @@ class LambdaLayerValidator:
             functions_missing_layer = []
             function_details = {}
 
-            for function_name in EXPECTED_LAMBDA_FUNCTIONS:
-                full_function_name = f"{PROJECT_PREFIX}-{ENVIRONMENT}-{function_name}"
+            full_function_names = {
+                function_name: f"{PROJECT_PREFIX}-{ENVIRONMENT}-{function_name}"
+                for function_name in EXPECTED_LAMBDA_FUNCTIONS
+            }
 
-                try:
-                    # Get function configuration
-                    response = self.lambda_client.get_function(
-                        FunctionName=full_function_name
+            # Get all function configurations concurrently
+            max_workers = min(FUNCTION_LOOKUP_WORKERS, len(full_function_names))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {
+                    function_name: executor.submit(
+                        self.lambda_client.get_function, FunctionName=full_function_name
                     )
+                    for function_name, full_function_name in full_function_names.items()
+                }
+
+            # Process responses in declaration order so the report is stable
+            for function_name, future in futures.items():
+                full_function_name = full_function_names[function_name]
+
+                try:
+                    response = future.result()
                     config = response["Configuration"]
 
                     # Check if function uses the layer
@@ -422,24 +487,27 @@ class LambdaLayerValidator:
     def validate_python_syntax_and_imports(self) -> bool:
         """Validate Python syntax and import structure of layer modules"""
         try:
-            layer_path = Path("src/layers/common_utils/python")
+            layer_entries = self._layer_entries or {}
             syntax_errors = []
             import_errors = []
             valid_modules = []
 
             for module_file in EXPECTED_LAYER_MODULES:
-                module_path = layer_path / module_file
-
-                if not module_path.exists():
+                if module_file not in layer_entries:
                     continue
+                module_path = Path(layer_entries[module_file].path)
 
                 # Test Python syntax
                 try:
-                    with open(module_path, "r", encoding="utf-8") as f:
-                        source_code = f.read()
+                    source_code = self._module_source(module_file)
 
-                    # Compile to check syntax
-                    compile(source_code, str(module_path), "exec")
+                    # Parse once and keep the tree for the documentation check,
+                    # then compile the tree to catch compile-time errors as well
+                    tree = compile(
+                        source_code, str(module_path), "exec", ast.PyCF_ONLY_AST
+                    )
+                    self._module_asts[module_file] = tree
+                    compile(tree, str(module_path), "exec")
 
                     # Test imports (basic check)
                     if module_file != "__init__.py":  # Skip __init__.py for import test
@@ -505,38 +573,78 @@ class LambdaLayerValidator:
     def validate_documentation_standards(self) -> bool:
         """Validate that all modules have proper documentation headers and comments"""
         try:
-            layer_path = Path("src/layers/common_utils/python")
+            layer_entries = self._layer_entries or {}
             documentation_issues = []
             well_documented_modules = []
 
             for module_file in EXPECTED_LAYER_MODULES:
-                module_path = layer_path / module_file
-
-                if not module_path.exists():
+                if module_file not in layer_entries:
                     continue
 
-                with open(module_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                source = self._module_source(module_file)
+
+                # The file header is the leading block of comment lines
+                header_lines = []
+                for line in (
+                    source[:MODULE_HEADER_SCAN_BYTES]
+                    .decode("utf-8", errors="ignore")
+                    .splitlines()
+                ):
+                    if not line.startswith("#"):
+                        break
+                    header_lines.append(line)
+                header = "\n".join(header_lines)
 
                 issues = []
 
                 # Check for proper file header
-                if not content.startswith(
+                if not header.startswith(
                     "# ============================================================================="
                 ):
                     issues.append("Missing proper file header")
 
                 # Check for **Purpose:** in header
-                if "**Purpose:**" not in content:
+                if "**Purpose:**" not in header:
                     issues.append("Missing **Purpose:** in header")
 
                 # Check for **Scope:** in header
-                if "**Scope:**" not in content:
+                if "**Scope:**" not in header:
                     issues.append("Missing **Scope:** in header")
 
-                # Check for function docstrings (basic check)
-                if "def " in content and '"""' not in content:
-                    issues.append("Functions missing docstrings")
+                # Check for docstrings on module functions and class methods,
+                # reusing the tree from the syntax validation; modules that do
+                # not parse are reported there
+                tree = self._module_asts.get(module_file)
+                if tree is None:
+                    try:
+                        tree = ast.parse(
+                            source, filename=layer_entries[module_file].path
+                        )
+                    except SyntaxError:
+                        tree = None
+
+                if tree is not None:
+                    function_types = (ast.FunctionDef, ast.AsyncFunctionDef)
+                    checked_functions = []
+                    for node in tree.body:
+                        if isinstance(node, function_types):
+                            checked_functions.append(node)
+                        elif isinstance(node, ast.ClassDef):
+                            checked_functions.extend(
+                                method
+                                for method in node.body
+                                if isinstance(method, function_types)
+                            )
+                    undocumented_functions = [
+                        node.name
+                        for node in checked_functions
+                        if ast.get_docstring(node) is None
+                    ]
+                    if undocumented_functions:
+                        issues.append(
+                            "Functions missing docstrings: "
+                            f"{', '.join(undocumented_functions)}"
+                        )
 
                 if issues:
                     documentation_issues.append(f"{module_file}: {', '.join(issues)}")
@@ -592,17 +700,24 @@ class LambdaLayerValidator:
             file_count = 0
             large_files = []
 
-            for file_path in layer_path.rglob("*"):
-                if file_path.is_file():
-                    size = file_path.stat().st_size
-                    total_size += size
-                    file_count += 1
-
-                    # Flag files larger than 1MB
-                    if size > 1024 * 1024:
-                        large_files.append(
-                            f"{file_path.name}: {size / (1024*1024):.2f}MB"
-                        )
+            # Walk the tree with scandir so file types come from the directory
+            # entries instead of a separate stat per path
+            pending_dirs = [layer_path]
+            while pending_dirs:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif entry.is_file():
+                            size = entry.stat().st_size
+                            total_size += size
+                            file_count += 1
+
+                            # Flag files larger than 1MB
+                            if size > 1024 * 1024:
+                                large_files.append(
+                                    f"{entry.name}: {size / (1024*1024):.2f}MB"
+                                )
 
             # Convert to MB
             total_size_mb = total_size / (1024 * 1024)